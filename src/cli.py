@@ -10,9 +10,9 @@ import platform
 from pathlib import Path
 
 # Local imports from src/
+# Command implementations are imported inside their branches in main() so that
+# help and version output don't pay for loading the database and file layers
 from config import ROMS_DIR, DATABASE_PATH, MERGE_SCRIPT_PATH, TARGET_DIR
-from core.importer import import_games
-from core.merger import generate_merge_script, clean_target_directory
 
 
 def detect_platform_and_shell():
@@ -101,6 +101,8 @@ def main():
     args = parser.parse_args()
     
     if args.command == "import":
+        from core.importer import import_games
+        
         start_time = time.time()
         stats = import_games(args.src, args.db)
         end_time = time.time()
@@ -114,6 +116,8 @@ def main():
         print(f"Execution time:  {end_time - start_time:.2f} seconds")
     
     elif args.command == "generate":
+        from core.merger import generate_merge_script
+        
         start_time = time.time()
         file_count = generate_merge_script(args.db, args.output, args.target)
         end_time = time.time()
@@ -121,6 +125,8 @@ def main():
         print(f"Execution time: {end_time - start_time:.2f} seconds")
     
     elif args.command == "merge":
+        from core.merger import clean_target_directory
+        
         start_time = time.time()
         
         # Clean target directory
@@ -4,6 +4,7 @@ Configuration module for the C64 ROM collector.
 This module centralizes all configuration values used across the application.
 All paths are handled in a platform-independent way using pathlib.Path.
 """
+import re
 from pathlib import Path
 
 # Get the project root directory (parent of src)
@@ -19,7 +20,7 @@ DATABASE_PATH = BUILD_DIR / "c64_games.db"
 MERGE_SCRIPT_PATH = BUILD_DIR / "merge_collection.sh"
 
 # Database configuration
-BATCH_SIZE = 1000  # Number of records to insert in one batch
+BATCH_SIZE = 1000  # Number of rows to fetch from the database at a time
 
 # Format priorities (higher number = higher priority)
 FORMAT_PRIORITIES = {
@@ -62,6 +63,9 @@ SKIP_PATTERNS = [
     'Cartridge Plus'
 ]
 
+# Skip patterns as one alternation, so a string is scanned once for all of them
+SKIP_PATTERN_RE = re.compile('|'.join(re.escape(pattern) for pattern in SKIP_PATTERNS))
+
 # Multi-part patterns
 MULTI_PART_PATTERNS = [
     r'(Side|Part|Disk)\s*[0-9]+',  # Side 1, Part 2, Disk 3
@@ -2,7 +2,10 @@
 Import module that processes game files and imports them into the database.
 """
 import os
-from config import ROMS_DIR, DATABASE_PATH, BATCH_SIZE
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import repeat
+from config import ROMS_DIR, DATABASE_PATH
 from db.database import DatabaseManager
 from db.game_repository import GameRepository
 from files import get_all_collections
@@ -24,11 +27,10 @@ def import_games(src_dir=ROMS_DIR, db_path=DATABASE_PATH):
     
     # Initialize database
     db = DatabaseManager(db_path)
-    db.connect()
+    db.connect(bulk_load=True)
     db.reset_schema()
     repository = GameRepository(db)
     
-    all_game_data = []
     stats = {
         'total_files': 0,
         'processed_files': 0,
@@ -45,53 +47,62 @@ def import_games(src_dir=ROMS_DIR, db_path=DATABASE_PATH):
         db.close()
         return stats
         
-    # Process each collection
-    for collection in collections:
-        print(f"Processing collection: {collection}")
-        collection_path = os.path.join(src_dir, collection)
+    # Scan collections in parallel worker processes; database work stays in this process.
+    # Each collection's games are streamed into the insert as its scan finishes,
+    # instead of first gathering every game record into one list.
+    max_workers = min(len(collections), os.cpu_count() or 1)
+    db.execute('BEGIN')
+    try:
+        # A single collection (or CPU) gains nothing from a worker process, so scan it in place
+        with ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else nullcontext() as executor:
+            scan = executor.map if executor else map
+            results = scan(_scan_collection, repeat(src_dir), collections)
+            # scan_directory already stores paths with forward slashes
+            repository.insert_many(_iter_game_data(collections, results, stats), normalize_paths=False)
+            
+        print(f"\nImported {stats['processed_files']} files, building indexes...")
         
-        game_data_list, skipped, errors = scan_directory(collection_path, collection)
-        all_game_data.extend(game_data_list)
+        # Build indexes once the data is in place
+        db.create_indexes()
         
-        stats['processed_files'] += len(game_data_list)
-        stats['skipped_files'] += skipped
-        stats['error_files'] += errors
+        # Get stats using the new schema, in one statement:
+        # unique games, and multi-part games (games that have versions with multiple parts).
+        # Aggregating parts per version keeps the latter linear in the number of parts.
+        repository.db_manager.execute('''
+            SELECT 
+                (SELECT COUNT(*) FROM games),
+                (SELECT COUNT(DISTINCT v.game_id) 
+                 FROM game_versions v 
+                 JOIN (
+                     SELECT version_id 
+                     FROM game_parts 
+                     GROUP BY version_id 
+                     HAVING MIN(part_number) < MAX(part_number)
+                 ) p ON v.id = p.version_id)
+        ''')
+        stats['unique_games'], stats['multi_games'] = repository.db_manager.fetchone()
         
-    print(f"\nProcessed {stats['processed_files']} files, now importing to database...")
-      # Batch insert into database
-    batch_data = []
-    for game_data in all_game_data:
-        batch_data.append(game_data)
-        if len(batch_data) >= BATCH_SIZE:
-            _insert_batch(repository, batch_data)
-            batch_data = []
-            
-    if batch_data:
-        _insert_batch(repository, batch_data)
-    
-    # Get stats using the new schema
-    # Count unique games
-    repository.db_manager.execute('SELECT COUNT(*) FROM games')
-    stats['unique_games'] = repository.db_manager.fetchone()[0]
-    
-    # Count multi-part games (games that have versions with multiple parts)
-    repository.db_manager.execute('''
-        SELECT COUNT(DISTINCT g.id) 
-        FROM games g 
-        JOIN game_versions v ON g.id = v.game_id 
-        JOIN game_parts p1 ON v.id = p1.version_id 
-        JOIN game_parts p2 ON v.id = p2.version_id 
-        WHERE p1.part_number < p2.part_number
-    ''')
-    stats['multi_games'] = repository.db_manager.fetchone()[0]
+        db.commit()
+    except Exception:
+        db.rollback()
+        db.close()
+        raise
     
     db.close()
     print("\nImport complete!")
     return stats
 
 
-def _insert_batch(repository, batch):
-    """Helper function to insert a batch of records"""
-    for game_data in batch:
-        repository.insert_game(game_data)
-    repository.db_manager.commit()
+def _scan_collection(src_dir, collection):
+    """Scan a single collection. Defined at module level so worker processes can run it."""
+    return scan_directory(os.path.join(src_dir, collection), collection)
+
+
+def _iter_game_data(collections, results, stats):
+    """Yield the game data of each scanned collection, updating stats as it goes."""
+    for collection, (game_data_list, skipped, errors) in zip(collections, results):
+        print(f"Processing collection: {collection}")
+        stats['processed_files'] += len(game_data_list)
+        stats['skipped_files'] += skipped
+        stats['error_files'] += errors
+        yield from game_data_list
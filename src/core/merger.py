@@ -1,7 +1,7 @@
 """
 Module for generating merge script.
 """
-import os
+import posixpath
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -15,6 +15,10 @@ from files import (
     sanitize_full_path
 )
 
+# Write buffer for the generated scripts; large enough that most collections
+# are flushed to disk in a handful of writes
+SCRIPT_BUFFER_SIZE = 1 << 20
+
 
 def clean_target_directory(target_dir=str(TARGET_DIR)):
     """Clean target directory."""
@@ -85,43 +89,51 @@ def generate_merge_script(db_path=DATABASE_PATH, output_path=MERGE_SCRIPT_PATH,
         int: Number of files to be merged
     """
     db = DatabaseManager(db_path)
-    db.connect()
+    db.connect(read_only=True)
     repository = GameRepository(db)
     
     file_count = 0
-    m3u_files: Dict[str, List[Tuple[str, str]]] = {}
+    # Playlist entries per game, along with the game's sanitized name
+    m3u_files: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {}
 
     # Define script paths
     sh_path = str(Path(output_path))
     cmd_path = str(Path(output_path).with_suffix('.cmd'))
     
     # Handle both shell and batch script generation
-    with open(sh_path, 'w', encoding='utf-8') as sh_file, \
-         open(cmd_path, 'w', encoding='utf-8') as cmd_file:
+    with open(sh_path, 'w', encoding='utf-8', buffering=SCRIPT_BUFFER_SIZE) as sh_file, \
+         open(cmd_path, 'w', encoding='utf-8', buffering=SCRIPT_BUFFER_SIZE) as cmd_file:
         
         # Write headers
         sh_file.write('#!/bin/bash\n\n')
         cmd_file.write('@echo off\nREM Generated merge script for Windows\n\n')
         
-        # Create output directory
+        # Create output directory. Target paths are built by appending to this
+        # normalized prefix, so they never need joining or slash conversion per row.
         normalized_target = normalize_path_for_script(str(target_dir))
+        target_prefix = posixpath.join(normalized_target, '')
         _write_mkdir_command_sh(sh_file, normalized_target)
         _write_mkdir_command_cmd(cmd_file, normalized_target)
         
         # Use GameRepository to fetch the best versions of games
         best_versions = repository.get_best_versions()
         current_game = None
+        sanitized_game = None
+        sanitized_name = ''
         
-        # Process each game version
+        # Process each game version. Source paths are stored with forward
+        # slashes at import time, so they are used as-is here.
         for clean_name, format_ext, source_path, part_number, total_parts in best_versions:
             file_count += 1
-            source_path = normalize_path_for_script(source_path)
-            sanitized_name = sanitize_directory_name(clean_name)
+            
+            # Rows are ordered by name, so all parts of a game share one sanitized name
+            if clean_name != sanitized_game:
+                sanitized_name = sanitize_directory_name(clean_name)
+                sanitized_game = clean_name
             
             # For multi-part games, create a subdirectory
             if total_parts > 1:
-                target_subdir = os.path.join(str(target_dir), sanitized_name)
-                norm_subdir = normalize_path_for_script(target_subdir)
+                norm_subdir = target_prefix + sanitized_name
                 
                 if current_game != clean_name:
                     # Add comments for multi-part game
@@ -133,26 +145,25 @@ def generate_merge_script(db_path=DATABASE_PATH, output_path=MERGE_SCRIPT_PATH,
                     _write_mkdir_command_cmd(cmd_file, norm_subdir)
                 
                 # For multi-part games, preserve original disk notation
-                target_file = os.path.join(sanitized_name, f"{sanitized_name} (Disk {part_number}).{format_ext}")
-                rel_path = target_file.replace('\\', '/')
+                target_file = f"{sanitized_name}/{sanitized_name} (Disk {part_number}).{format_ext}"
 
                 # Add to m3u playlist with label
                 if clean_name not in m3u_files:
-                    m3u_files[clean_name] = []
-                m3u_files[clean_name].append((rel_path, f"Disk {part_number}"))
+                    m3u_files[clean_name] = (sanitized_name, [])
+                m3u_files[clean_name][1].append((target_file, f"Disk {part_number}"))
             else:
                 # Single file game
                 target_file = f"{sanitized_name}.{format_ext}"
             
-            target_path = normalize_path_for_script(os.path.join(str(target_dir), target_file))
+            target_path = target_prefix + target_file
             
             # Write copy commands
             _write_copy_command_sh(sh_file, source_path, target_path, target_file)
             _write_copy_command_cmd(cmd_file, source_path, target_path, target_file)
         
         # Write .m3u files for multi-disk games
-        for game_name, disk_files in m3u_files.items():
-            m3u_path = normalize_path_for_script(os.path.join(str(target_dir), f"{sanitize_directory_name(game_name)}.m3u"))
+        for sanitized_name, disk_files in m3u_files.values():
+            m3u_path = f"{target_prefix}{sanitized_name}.m3u"
             _write_m3u_file_sh(sh_file, m3u_path, disk_files)
             _write_m3u_file_cmd(cmd_file, m3u_path, disk_files)
     
@@ -2,23 +2,44 @@
 Core functionality for processing game files.
 """
 import os
+from collections import namedtuple
 from utils.name_cleaner import clean_name, extract_region, get_region_priority
-from utils.format_handler import get_format_priority, is_multi_part, get_multi_part_info
+from utils.format_handler import format_priority_for_ext, get_multi_part
 from files import should_skip_file
 
+# Paths only need their separators converted on platforms that don't use '/'
+_NEEDS_SLASH_FIX = os.sep != '/'
 
-def process_file(file_path, collection_name):
+# A processed game file. Tuples are much smaller than dicts and can be passed to
+# executemany-style code with positional unpacking.
+GameRecord = namedtuple('GameRecord', [
+    'source_path',
+    'original_name',
+    'clean_name',
+    'format',
+    'collection',
+    'format_priority',
+    'region',
+    'region_priority',
+    'is_multi_part',
+    'part_number'
+])
+
+
+def process_file(file_path, collection_name, original_name=None):
     """
     Process a single file and return its game data.
     
     Args:
         file_path (str): Path to the file
         collection_name (str): Name of the collection
+        original_name (str): File name, if already known; taken from file_path otherwise
         
     Returns:
-        dict: Game data dictionary, or None if file should be skipped
+        GameRecord: Game data, or None if file should be skipped
     """
-    original_name = os.path.basename(file_path)
+    if original_name is None:
+        original_name = os.path.basename(file_path)
     format_ext = os.path.splitext(original_name)[1][1:].lower()
     clean_title = clean_name(original_name)
     
@@ -30,22 +51,22 @@ def process_file(file_path, collection_name):
     region = extract_region(original_name)
     region_priority = get_region_priority(region)
     
-    format_priority = get_format_priority(original_name)
-    is_multi = is_multi_part(file_path, original_name)
-    part_num = get_multi_part_info(file_path, original_name) if is_multi else 0
+    # The extension is already parsed, so skip get_format_priority's own parsing
+    format_priority = format_priority_for_ext(format_ext)
+    is_multi, part_num = get_multi_part(file_path, original_name)
     
-    return {
-        'source_path': file_path,
-        'original_name': original_name,
-        'clean_name': clean_title,
-        'format': format_ext,
-        'collection': collection_name,
-        'format_priority': format_priority,
-        'region': region,
-        'region_priority': region_priority,
-        'is_multi_part': 1 if is_multi else 0,
-        'part_number': part_num
-    }
+    return GameRecord(
+        source_path=file_path,
+        original_name=original_name,
+        clean_name=clean_title,
+        format=format_ext,
+        collection=collection_name,
+        format_priority=format_priority,
+        region=region,
+        region_priority=region_priority,
+        is_multi_part=1 if is_multi else 0,
+        part_number=part_num
+    )
 
 
 def scan_directory(base_dir, collection_name):
@@ -63,25 +84,52 @@ def scan_directory(base_dir, collection_name):
     skipped_files = 0
     error_files = 0
     
-    for root, dirs, files in os.walk(base_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            
-            # Normalize path for consistency
-            file_path = file_path.replace('\\', '/')
-            
-            if should_skip_file(file_path, file):
+    for entry in _iter_files(base_dir):
+        # Normalize path for consistency. This is the only normalization scanned
+        # paths get; the importer tells the database not to repeat it.
+        file_path = entry.path.replace(os.sep, '/') if _NEEDS_SLASH_FIX else entry.path
+        name = entry.name
+        
+        if should_skip_file(file_path, name):
+            skipped_files += 1
+            continue
+        
+        try:
+            # The directory listing already gives the name, so don't re-derive it from the path
+            game_data = process_file(file_path, collection_name, name)
+            if game_data:
+                game_data_list.append(game_data)
+            else:
                 skipped_files += 1
-                continue
-            
-            try:
-                game_data = process_file(file_path, collection_name)
-                if game_data:
-                    game_data_list.append(game_data)
-                else:
-                    skipped_files += 1
-            except Exception as e:
-                print(f"Error processing {file_path}: {str(e)}")
-                error_files += 1
+        except Exception as e:
+            print(f"Error processing {file_path}: {str(e)}")
+            error_files += 1
     
     return game_data_list, skipped_files, error_files
+
+
+def _iter_files(path):
+    """
+    Yield a DirEntry for every file under path, in the same order as os.walk,
+    leaving out Originals folders.
+    
+    DirEntry objects carry the name, path and file type from the directory
+    listing, so no extra stat or path joining is needed per file.
+    """
+    try:
+        with os.scandir(path) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, don't descend into symlinked directories. Originals
+                    # folders are pruned too: should_skip_file rejects everything in them.
+                    if not entry.is_symlink() and entry.name != 'Originals':
+                        subdirs.append(entry.path)
+                else:
+                    yield entry
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+    
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
@@ -3,7 +3,28 @@ Database operations for the ROM collector.
 """
 import os
 import sqlite3
-from config import DATABASE_PATH
+from pathlib import Path
+from config import DATABASE_PATH, BATCH_SIZE
+
+# PRAGMAs for rebuilding the database from scratch, where durability during the load is not needed
+BULK_LOAD_PRAGMAS = (
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA synchronous=OFF',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA locking_mode=EXCLUSIVE'
+)
+
+# PRAGMAs for connections that only read, such as the merger's
+READ_ONLY_PRAGMAS = (
+    'PRAGMA query_only=ON',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-65536'
+)
+
+# Let SQLite memory-map up to 256 MiB of the database file, so full reads such as
+# the merger's best-version query reference pages directly instead of copying them
+MMAP_SIZE = 256 * 1024 * 1024
 
 
 class DatabaseManager:
@@ -13,8 +34,25 @@ class DatabaseManager:
         self.conn = None
         self.cursor = None
     
-    def connect(self):
-        """Connect to the database."""
+    def connect(self, bulk_load=False, read_only=False):
+        """
+        Connect to the database.
+        
+        Args:
+            bulk_load (bool): Tune the connection for a bulk import, trading durability for speed
+            read_only (bool): Open an existing database without write access
+        """
+        if read_only:
+            # mode=ro opens the file without taking write locks and fails rather than
+            # creating an empty database when the path is wrong
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            self.conn = sqlite3.connect(uri, uri=True)
+            self.cursor = self.conn.cursor()
+            self.execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+            for pragma in READ_ONLY_PRAGMAS:
+                self.execute(pragma)
+            return self.conn
+        
         # Ensure directory exists
         db_dir = os.path.dirname(self.db_path)
         if db_dir:
@@ -25,6 +63,13 @@ class DatabaseManager:
         
         self.conn = sqlite3.connect(self.db_path)
         self.cursor = self.conn.cursor()
+        self.execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+        if bulk_load:
+            # A bulk load manages its own transaction with an explicit BEGIN, so the module's
+            # implicit transaction handling is turned off instead of inspecting every statement
+            self.conn.isolation_level = None
+            for pragma in BULK_LOAD_PRAGMAS:
+                self.execute(pragma)
         return self.conn
         
     def close(self):
@@ -37,6 +82,11 @@ class DatabaseManager:
         if self.conn:
             self.conn.commit()
             
+    def rollback(self):
+        """Roll back uncommitted changes."""
+        if self.conn:
+            self.conn.rollback()
+            
     def execute(self, sql, params=None):
         """Execute a SQL statement."""
         if params:
@@ -55,8 +105,23 @@ class DatabaseManager:
         """Fetch one result from the last query."""
         return self.cursor.fetchone()
         
+    def fetchmany(self, size=BATCH_SIZE):
+        """Fetch the next chunk of results from the last query."""
+        return self.cursor.fetchmany(size)
+        
+    def iter_results(self, size=BATCH_SIZE):
+        """Iterate over the results of the last query, fetching them in chunks."""
+        for rows in iter(lambda: self.fetchmany(size), []):
+            yield from rows
+        
     def create_schema(self):
         """Create the database schema."""
+        self.create_tables()
+        self.create_indexes()
+        self.commit()
+        
+    def create_tables(self):
+        """Create the database tables and the unique index they rely on."""
         # Create games table - stores unique games
         self.execute('''CREATE TABLE IF NOT EXISTS games (
             id INTEGER PRIMARY KEY,
@@ -84,25 +149,28 @@ class DatabaseManager:
             original_name TEXT NOT NULL,
             FOREIGN KEY (version_id) REFERENCES game_versions(id)
         )''')
-            
-        # Create indexes
+        
+        # Unique game names are needed by INSERT OR IGNORE, so this index can't be deferred
         self.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_games_clean_name ON games (clean_name)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_versions_game_id ON game_versions (game_id)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_versions_format ON game_versions (format)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_versions_collection ON game_versions (collection)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_versions_format_priority ON game_versions (format_priority)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_versions_region_priority ON game_versions (region_priority)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_parts_version_id ON game_parts (version_id)')
-        self.execute('CREATE INDEX IF NOT EXISTS idx_parts_part_number ON game_parts (part_number)')
         
-        self.commit()
+    def create_indexes(self):
+        """Create the lookup indexes. Call after bulk inserts to avoid per-row index maintenance."""
+        # Matches the best-version ranking (per game, by format, region, collection, then
+        # insertion order) and covers its columns, so the window function runs without a sort
+        self.execute('''CREATE INDEX IF NOT EXISTS idx_versions_rank ON game_versions (
+            game_id, format_priority DESC, region_priority DESC, collection, id, format
+        )''')
+        # Covers the parts lookup of the best-version query, so it never touches the table
+        self.execute('CREATE INDEX IF NOT EXISTS idx_parts_version_id ON game_parts (version_id, part_number, source_path)')
+        self.execute('CREATE INDEX IF NOT EXISTS idx_parts_part_number ON game_parts (part_number)')
         
     def reset_schema(self):
-        """Drop and recreate the schema."""
+        """Drop and recreate the tables. Indexes are left to create_indexes()."""
         self.execute('DROP TABLE IF EXISTS game_parts')
         self.execute('DROP TABLE IF EXISTS game_versions')
         self.execute('DROP TABLE IF EXISTS games')
-        self.create_schema()
+        self.create_tables()
+        self.commit()
         
     def insert_game(self, game_data):
         """
@@ -124,6 +192,9 @@ class DatabaseManager:
         self.execute('SELECT id FROM games WHERE clean_name = ?', (game_data['clean_name'],))
         game_id = self.fetchone()[0]
         
+        # Store paths with forward slashes so the merger can use them as-is
+        source_path = game_data['source_path'].replace('\\', '/')
+        
         # Check if a version already exists for this game in this collection with this format and region
         self.execute('''
             SELECT id FROM game_versions 
@@ -138,7 +209,7 @@ class DatabaseManager:
             self.execute('''
                 SELECT id FROM game_parts 
                 WHERE version_id = ? AND part_number = ? AND source_path = ?
-            ''', (version_id, game_data['part_number'], game_data['source_path']))
+            ''', (version_id, game_data['part_number'], source_path))
             
             existing_part = self.fetchone()
             if existing_part:
@@ -192,9 +263,111 @@ class DatabaseManager:
         ''', (
             version_id,
             game_data['part_number'],
-            game_data['source_path'],
+            source_path,
             game_data['original_name']
         ))
         part_id = self.cursor.lastrowid
-        
+
         return game_id, version_id, part_id
+
+    def insert_games(self, games, normalize_paths=True):
+        """
+        Insert many games at once using executemany.
+
+        Applies the same version/part rules as insert_game, but resolves them
+        in memory in a single pass, so games can be any iterable (including a
+        generator) and each table is written with one executemany call. Part
+        rows are streamed into executemany as they are resolved.
+
+        Args:
+            games (iterable): GameRecord tuples, as returned by core.processor.process_file
+            normalize_paths (bool): Convert backslashes in source paths to forward slashes.
+                Pass False for records from core.processor.scan_directory, which already
+                normalizes them.
+
+        Returns:
+            int: Number of parts inserted
+        """
+        # Load existing games, versions and parts so the rules also hold for a non-empty database.
+        # Rows are streamed rather than fetched into lists, since only the dicts built from them are kept.
+        self.execute('SELECT clean_name, id FROM games')
+        game_ids = dict(self.iter_results())
+        versions = {}
+        self.execute('SELECT id, game_id, collection, format, region FROM game_versions ORDER BY id')
+        for version_id, game_id, collection, format_ext, region in self.iter_results():
+            versions.setdefault((game_id, collection, format_ext, region), version_id)
+        version_parts = {version_id: {} for version_id in versions.values()}
+        self.execute('SELECT version_id, part_number, source_path FROM game_parts')
+        for version_id, part_number, source_path in self.iter_results():
+            if version_id in version_parts:
+                version_parts[version_id].setdefault(part_number, set()).add(source_path)
+
+        self.execute('SELECT COALESCE(MAX(id), 0) FROM games')
+        next_game_id = self.fetchone()[0] + 1
+        self.execute('SELECT COALESCE(MAX(id), 0) FROM game_versions')
+        next_version_id = self.fetchone()[0] + 1
+
+        game_rows = []
+        version_rows = []
+        part_count = 0
+
+        def part_rows():
+            # Resolves each game while executemany pulls its part row, so part rows
+            # are never collected in a list. Games and versions are far fewer and
+            # are written afterwards; the ids are already assigned here.
+            nonlocal next_game_id, next_version_id, part_count
+            for (source_path, original_name, clean_name, format_ext, collection,
+                 format_priority, region, region_priority, _, part_number) in games:
+                if normalize_paths:
+                    source_path = source_path.replace('\\', '/')
+                game_id = game_ids.get(clean_name)
+                if game_id is None:
+                    game_id = game_ids[clean_name] = next_game_id
+                    next_game_id += 1
+                    game_rows.append((game_id, clean_name))
+                key = (game_id, collection, format_ext, region)
+
+                version_id = versions.get(key)
+                if version_id is not None:
+                    parts = version_parts[version_id]
+                    if source_path in parts.get(part_number, ()):
+                        # Part already exists
+                        continue
+                    if part_number in parts:
+                        # Different file with same part number (e.g., Alt version)
+                        version_id = None
+                    else:
+                        parts[part_number] = {source_path}
+
+                if version_id is None:
+                    version_id = next_version_id
+                    next_version_id += 1
+                    version_rows.append((
+                        version_id,
+                        game_id,
+                        collection,
+                        format_ext,
+                        format_priority,
+                        region,
+                        region_priority
+                    ))
+                    if key not in versions:
+                        versions[key] = version_id
+                        version_parts[version_id] = {part_number: {source_path}}
+
+                part_count += 1
+                yield (version_id, part_number, source_path, original_name)
+
+        self.executemany('''
+            INSERT INTO game_parts (
+                version_id, part_number, source_path, original_name
+            ) VALUES (?, ?, ?, ?)
+        ''', part_rows())
+        self.executemany('INSERT INTO games (id, clean_name) VALUES (?, ?)', game_rows)
+        self.executemany('''
+            INSERT INTO game_versions (
+                id, game_id, collection, format, format_priority, region, region_priority
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', version_rows)
+
+        return part_count
@@ -33,6 +33,19 @@ class GameRepository:
         """
         return self.db_manager.insert_game(game_data)
 
+    def insert_many(self, batch, normalize_paths=True):
+        """
+        Insert a batch of games into the database in bulk.
+
+        Args:
+            batch (iterable): GameRecord tuples
+            normalize_paths (bool): Convert backslashes in source paths to forward slashes
+
+        Returns:
+            int: Number of parts inserted
+        """
+        return self.db_manager.insert_games(batch, normalize_paths)
+
     def get_game_by_name(self, clean_name):
         """
         Retrieve a game by its clean name.
@@ -49,6 +62,8 @@ class GameRepository:
     def reset_database(self):
         """Reset the database schema."""
         self.db_manager.reset_schema()
+        self.db_manager.create_indexes()
+        self.db_manager.commit()
 
     def fetch_all_games(self):
         """Fetch all games from the database."""
@@ -60,37 +75,41 @@ class GameRepository:
         Retrieve the best version of each game along with its parts.
         Now includes region prioritization.
 
+        Rows are streamed from the cursor, so consume them before running another query.
+
         Returns:
-            list: A list of tuples containing game details and part information.
+            iterator: Tuples containing game details and part information.
         """
+        # Rank versions on game_versions alone (driven by idx_versions_rank), then
+        # join only the winning version of each game to its name and parts.
+        # Versions that still tie resolve to the first one inserted.
         self.db_manager.execute('''
-            WITH RankedVersions AS (
-                SELECT 
-                    g.clean_name,
-                    v.format,
-                    v.format_priority,
-                    v.collection,
-                    v.region,
-                    v.region_priority,
-                    v.id as version_id,
-                    ROW_NUMBER() OVER (
-                        PARTITION BY g.id 
-                        ORDER BY v.format_priority DESC, v.region_priority DESC, v.collection ASC
-                    ) as rn
-                FROM games g
-                JOIN game_versions v ON g.id = v.game_id
+            WITH BestVersions AS (
+                SELECT id, game_id, format
+                FROM (
+                    SELECT 
+                        id,
+                        game_id,
+                        format,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY game_id 
+                            ORDER BY format_priority DESC, region_priority DESC, collection ASC, id ASC
+                        ) as rn
+                    FROM game_versions
+                )
+                WHERE rn = 1
             )
             SELECT 
-                rv.clean_name,
-                rv.format,
+                g.clean_name,
+                bv.format,
                 p.source_path,
                 p.part_number,
-                COUNT(*) OVER (PARTITION BY rv.version_id) as total_parts
-            FROM RankedVersions rv
-            JOIN game_parts p ON rv.version_id = p.version_id
-            WHERE rv.rn = 1
-            ORDER BY rv.clean_name, p.part_number
+                COUNT(*) OVER (PARTITION BY bv.id) as total_parts
+            FROM BestVersions bv
+            JOIN games g ON g.id = bv.game_id
+            JOIN game_parts p ON p.version_id = bv.id
+            ORDER BY g.clean_name, p.part_number
         ''')
-        return self.db_manager.fetchall()
+        return self.db_manager.iter_results()
 
     # Additional repository methods can be added here as needed.
@@ -5,7 +5,9 @@ import os
 import shutil
 from pathlib import Path
 from typing import List, Union, Iterator
-from config import FORMAT_PRIORITIES, SKIP_PATTERNS
+from config import FORMAT_PRIORITIES, SKIP_PATTERN_RE
+
+_VALID_FORMATS = frozenset(FORMAT_PRIORITIES)
 
 def should_skip_file(path: Union[str, Path], filename: str) -> bool:
     """
@@ -18,21 +20,25 @@ def should_skip_file(path: Union[str, Path], filename: str) -> bool:
     Returns:
         True if file should be skipped, False otherwise
     """
-    # Convert to Path for safe operations
-    path_obj = Path(path)
-    
-    # Skip entries in Originals folder
-    if 'Originals' in path_obj.parts:
+    # Skip if not a recognized C64 ROM format. Checked first since it's the
+    # cheapest test and rejects the most files.
+    format_ext = os.path.splitext(filename)[1][1:].lower()
+    if format_ext not in _VALID_FORMATS:
         return True
     
-    # Skip system utilities and non-game content using configured patterns
-    if any(pattern in path or pattern in filename for pattern in SKIP_PATTERNS):
+    path_str = str(path)
+    
+    # Skip entries in Originals folder. The substring test avoids building a
+    # Path for the vast majority of files that can't match.
+    if 'Originals' in path_str and 'Originals' in Path(path_str).parts:
         return True
-      # Skip certain file types
-    format_ext = os.path.splitext(filename)[1][1:].lower()
     
-    # Valid C64 ROM formats    # Skip if not a recognized C64 ROM format
-    if format_ext not in FORMAT_PRIORITIES.keys():
+    # Skip system utilities and non-game content using configured patterns.
+    # The filename is usually the tail of the path, in which case the path
+    # search has already covered it.
+    if SKIP_PATTERN_RE.search(path_str):
+        return True
+    if not path_str.endswith(filename) and SKIP_PATTERN_RE.search(filename):
         return True
     
     return False
@@ -48,11 +54,11 @@ def get_all_collections(base_dir: str) -> List[str]:
     Returns:
         A list of collection directories
     """
-    if not os.path.exists(base_dir):
+    try:
+        with os.scandir(base_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return []
-        
-    return [d for d in os.listdir(base_dir) 
-            if os.path.isdir(os.path.join(base_dir, d))]
 
 
 def clean_directory(directory_path: str) -> bool:
@@ -77,12 +83,12 @@ def clean_directory(directory_path: str) -> bool:
                 return False
                 
             # Remove all content but keep directory
-            for item in os.listdir(directory_path):
-                item_path = os.path.join(directory_path, item)
-                if os.path.isfile(item_path):
-                    os.unlink(item_path)
-                elif os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
             return True
         else:
             # Create directory if it doesn't exist
@@ -187,7 +193,7 @@ def is_file(path: Union[str, Path]) -> bool:
     Returns:
         True if path is a regular file
     """
-    return Path(path).is_file()
+    return os.path.isfile(path)
 
 
 def is_dir(path: Union[str, Path]) -> bool:
@@ -200,4 +206,4 @@ def is_dir(path: Union[str, Path]) -> bool:
     Returns:
         True if path is a directory
     """
-    return Path(path).is_dir()
+    return os.path.isdir(path)
@@ -5,6 +5,16 @@ import re
 import os
 import posixpath
 
+# Precompiled patterns, in the order sanitize_directory_name applies them
+_PARENS_RE = re.compile(r'\s*\([^)]*\)')
+_WILDCARD_RE = re.compile(r'[?*]')
+_SPACES_RE = re.compile(r'\s+')
+_LONE_DOTS_RE = re.compile(r'(^|\s)\.+(\s|$)')
+_UNSAFE_CHARS_RE = re.compile(r'[<>:"|\\]')
+_UNSAFE_CHARS_AND_SPACES_RE = re.compile(r'[<>:"|\\\s]')
+_UNDERSCORES_RE = re.compile(r'_{2,}')
+_DRIVE_RE = re.compile(r'^[A-Za-z]:')
+
 def sanitize_directory_name(name: str, preserve_spaces: bool = True) -> str:
     """
     Sanitizes a directory name by removing/replacing problematic characters.
@@ -20,25 +30,25 @@ def sanitize_directory_name(name: str, preserve_spaces: bool = True) -> str:
         return "unnamed"
 
     # Remove all parentheses (and their contents)
-    name = re.sub(r'\s*\([^)]*\)', '', name)
+    name = _PARENS_RE.sub('', name)
 
     # Remove wildcard characters first
-    name = re.sub(r'[?*]', '', name)
+    name = _WILDCARD_RE.sub('', name)
 
     # Collapse multiple spaces to a single space and trim
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = _SPACES_RE.sub(' ', name).strip()
 
     # Remove dots surrounded by spaces or at start/end
-    name = re.sub(r'(^|\s)\.+(\s|$)', ' ', name).strip()
+    name = _LONE_DOTS_RE.sub(' ', name).strip()
     
     # Replace problematic characters
     if preserve_spaces:
-        name = re.sub(r'[<>:"|\\]', '_', name)
+        name = _UNSAFE_CHARS_RE.sub('_', name)
     else:
-        name = re.sub(r'[<>:"|\\\s]', '_', name)
+        name = _UNSAFE_CHARS_AND_SPACES_RE.sub('_', name)
     
     # Collapse multiple underscores to a single underscore
-    name = re.sub(r'_{2,}', '_', name)
+    name = _UNDERSCORES_RE.sub('_', name)
 
     # Trim dots and underscores (but not spaces)
     while name.startswith(('.', '_')):
@@ -88,7 +98,7 @@ def sanitize_full_path(path: str) -> str:
         rest = path[1:]
 
     # Handle Windows drive letters
-    elif re.match(r'^[A-Za-z]:', path):
+    elif _DRIVE_RE.match(path):
         root = path[0:3]  # Includes drive letter and :/
         rest = path[3:]
 
@@ -2,7 +2,36 @@
 Functions for format prioritization and multi-part game detection.
 """
 import re
-from config import FORMAT_PRIORITIES, SKIP_PATTERNS, MULTI_PART_PATTERNS
+from config import FORMAT_PRIORITIES, SKIP_PATTERN_RE, MULTI_PART_PATTERNS
+
+# Precompiled patterns for multi-part detection. The configured patterns are only
+# tested for any match, so they are combined into one alternation.
+_MULTI_PART_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in MULTI_PART_PATTERNS), re.IGNORECASE)
+_PART_NUMBER_RE = re.compile(r'(Side|Part|Disk)\s*([0-9]+)', re.IGNORECASE)
+_SIDE_LETTER_RE = re.compile(r'Side\s*([A-B])', re.IGNORECASE)
+_LEVELS_RE = re.compile(r'Levels?\s*([0-9]+)(?:\s*(?:and|&|\+|-)\s*([0-9]+))?', re.IGNORECASE)
+
+# Names that look multi-part but carry no part number
+_PART_INFO_SKIP_PATTERNS = (
+    "Tape Port Dongle",
+    "Savedisk",
+    "Special Edition",
+    "(v2)",
+    "Re-release"
+)
+
+# Substring list as one alternation, like config.SKIP_PATTERN_RE
+_PART_INFO_SKIP_RE = re.compile('|'.join(re.escape(pattern) for pattern in _PART_INFO_SKIP_PATTERNS))
+
+
+def _full_path(path, name):
+    """
+    Join a path and a file name for pattern matching.
+    
+    process_file passes the file's full path, which already ends with its name,
+    so the name is only appended when the path is a directory.
+    """
+    return path if path.endswith(name) else path + name
 
 
 def get_format_priority(filename):
@@ -17,7 +46,20 @@ def get_format_priority(filename):
           2: Disk images (.d64, .g64, .nib) - Complete disk images with protection
           1: Program files (.prg), Tape images (.tap, .t64) - Lowest priority
           0: Unknown formats"""    
-    ext = filename.lower().split('.')[-1]
+    # Only the text after the last dot matters, so don't split or lowercase the whole name
+    return format_priority_for_ext(filename.rpartition('.')[2].lower())
+
+
+def format_priority_for_ext(ext):
+    """
+    Get the priority of an already extracted file extension.
+    
+    Args:
+        ext (str): The lowercase extension, without the dot
+        
+    Returns:
+        int: The priority level, as for get_format_priority()
+    """
     return FORMAT_PRIORITIES.get(ext, 0)
 
 
@@ -32,15 +74,13 @@ def is_multi_part(path, name):
     Returns:
         bool: True if this is a multi-part game, False otherwise
     """
-    full_path = path + name
+    full_path = _full_path(path, name)
       # Skip certain patterns that might give false positives
-    if any(p in full_path for p in SKIP_PATTERNS):
+    if SKIP_PATTERN_RE.search(full_path):
         return False
     
     # Check for various multi-part patterns
-    patterns = MULTI_PART_PATTERNS
-    
-    return any(bool(re.search(pattern, full_path, re.IGNORECASE)) for pattern in patterns)
+    return _MULTI_PART_RE.search(full_path) is not None
 
 
 def get_multi_part_info(path, name):
@@ -54,30 +94,24 @@ def get_multi_part_info(path, name):
     Returns:
         int: The part number, or 0 if not found
     """
-    full_path = path + name
+    full_path = _full_path(path, name)
     
     # Skip certain patterns
-    if any(p in full_path for p in [
-        "Tape Port Dongle",
-        "Savedisk",
-        "Special Edition",
-        "(v2)",
-        "Re-release"
-    ]):
+    if _PART_INFO_SKIP_RE.search(full_path):
         return 0
         
     # First try normal numeric patterns
-    match = re.search(r'(Side|Part|Disk)\s*([0-9]+)', full_path, re.IGNORECASE)
+    match = _PART_NUMBER_RE.search(full_path)
     if match:
         return int(match.group(2))
     
     # Check for Side A/B format
-    match = re.search(r'Side\s*([A-B])', full_path, re.IGNORECASE)
+    match = _SIDE_LETTER_RE.search(full_path)
     if match:
         # Convert A -> 1, B -> 2
         return ord(match.group(1).upper()) - ord('A') + 1
       # Handle sequential level numbering
-    matches = list(re.finditer(r'Levels?\s*([0-9]+)(?:\s*(?:and|&|\+|-)\s*([0-9]+))?', full_path, re.IGNORECASE))
+    matches = list(_LEVELS_RE.finditer(full_path))
     if matches:
         # Count how many level pairs came before this one
         current_match = matches[0]
@@ -86,3 +120,33 @@ def get_multi_part_info(path, name):
         return (first_num + 1) // 2
     
     return 0
+
+
+def get_multi_part(path, name):
+    """
+    Check if a file is part of a multi-part game and extract its part number.
+    
+    Same result as is_multi_part() followed by get_multi_part_info(), but the
+    common case of a numbered Side/Part/Disk is answered with a single search.
+    
+    Args:
+        path (str): The file path
+        name (str): The filename
+        
+    Returns:
+        tuple: (is_multi, part_number), where part_number is 0 for single-part games
+    """
+    full_path = _full_path(path, name)
+    if SKIP_PATTERN_RE.search(full_path):
+        return False, 0
+    
+    # A numbered Side/Part/Disk both marks a multi-part game and gives its number
+    match = _PART_NUMBER_RE.search(full_path)
+    if match:
+        if _PART_INFO_SKIP_RE.search(full_path):
+            return True, 0
+        return True, int(match.group(2))
+    
+    if not _MULTI_PART_RE.search(full_path):
+        return False, 0
+    return True, get_multi_part_info(path, name)
@@ -4,6 +4,48 @@ Utility functions for cleaning and normalizing game names.
 import os
 import re
 
+# Precompiled patterns, in the order they are applied
+_MULTI_PART_RE = re.compile(r'(Side|Part|Disk)\s*[0-9]+', re.IGNORECASE)
+_REGION_GROUP_RE = re.compile(r'\(([^)]*(?:USA|Europe|World|Japan|Eur|Jp|En|PAL|NTSC)[^)]*)\)', re.IGNORECASE)
+_EUR_RE = re.compile(r'\bEur\b', re.IGNORECASE)
+_JP_RE = re.compile(r'\bJp\b', re.IGNORECASE)
+_EN_RE = re.compile(r'\bEn\b', re.IGNORECASE)
+
+_PART_SUFFIX_RE = re.compile(r'\s*[\(\[]?(Side|Part|Disk)\s*[0-9]+[\)\]]?.*$', re.IGNORECASE)
+# Bracketed region, version, suffix and collection markers, removed in one pass
+_TAG_RE = re.compile(
+    r'\s*[\(\[](?:'
+    r'(?:USA|Europe|World|Japan|Eur?|Jp|En|PAL|NTSC)[^\)\]]*'
+    r'|v[\d\.]+'
+    r'|Version\s+[a-z0-9\.]+'
+    r'|Budget|Alt|Alternative|Unl|Aftermarket|Program|Tape\s*Port\s*Dongle'
+    r'|Compilation|Collection'
+    r')[\)\]]',
+    re.IGNORECASE
+)
+_VERSION_RE = re.compile(r'v[\d\.]+\b')
+_ROMAN_RE = re.compile(r'\b(?:II|III|IV|VI|VII|VIII)\b')
+_ROMAN_NUMERALS = {'II': '2', 'III': '3', 'IV': '4', 'VI': '6', 'VII': '7', 'VIII': '8'}
+_PARENS_RE = re.compile(r'\s*\([^)]*\)')
+_BRACKETS_RE = re.compile(r'\s*\[[^\]]*\]')
+
+# Define region priorities here to avoid circular imports
+_REGION_PRIORITIES = {
+    'Europe': 6,     # Europe releases (highest priority)
+    'PAL': 5,        # PAL-specific releases
+    'World': 4,      # World releases
+    'USA': 3,        # USA releases
+    'Japan': 2,      # Japan releases
+    'NTSC': 1,       # NTSC-specific releases
+    '': 0            # No region specified (lowest priority)
+}
+# Named regions, highest priority first, for partial matches
+_REGIONS_BY_PRIORITY = tuple(sorted(
+    (region for region in _REGION_PRIORITIES if region),
+    key=_REGION_PRIORITIES.__getitem__,
+    reverse=True
+))
+
 def extract_region(name):
     """
     Extract region information from a game name.
@@ -15,17 +57,17 @@ def extract_region(name):
         str: The region code (USA, Europe, World, Japan, etc.) or empty string if not found
     """
     # Skip region extraction for multi-part games to avoid false positives
-    if re.search(r'(Side|Part|Disk)\s*[0-9]+', name, re.IGNORECASE):
+    if _MULTI_PART_RE.search(name):
         return ""
     
     # Look for common region patterns
-    region_match = re.search(r'\(([^)]*(?:USA|Europe|World|Japan|Eur|Jp|En|PAL|NTSC)[^)]*)\)', name, flags=re.IGNORECASE)
+    region_match = _REGION_GROUP_RE.search(name)
     if region_match:
         region_text = region_match.group(1).strip()
         # Normalize common region names
-        region_text = re.sub(r'\bEur\b', 'Europe', region_text, flags=re.IGNORECASE)
-        region_text = re.sub(r'\bJp\b', 'Japan', region_text, flags=re.IGNORECASE)
-        region_text = re.sub(r'\bEn\b', 'English', region_text, flags=re.IGNORECASE)
+        region_text = _EUR_RE.sub('Europe', region_text)
+        region_text = _JP_RE.sub('Japan', region_text)
+        region_text = _EN_RE.sub('English', region_text)
         return region_text
     return ""
 
@@ -40,27 +82,18 @@ def get_region_priority(region):
     Returns:
         int: The priority value (higher is better)
     """
-    # Define region priorities here to avoid circular imports
-    REGION_PRIORITIES = {
-        'Europe': 6,     # Europe releases (highest priority)
-        'PAL': 5,        # PAL-specific releases
-        'World': 4,      # World releases
-        'USA': 3,        # USA releases
-        'Japan': 2,      # Japan releases
-        'NTSC': 1,       # NTSC-specific releases
-        '': 0            # No region specified (lowest priority)
-    }
-    
     # Check exact matches first
-    if region in REGION_PRIORITIES:
-        return REGION_PRIORITIES[region]
+    priority = _REGION_PRIORITIES.get(region)
+    if priority is not None:
+        return priority
     
     # Check for partial matches (e.g., "USA, Europe" should match "USA")
-    for priority_region in sorted(REGION_PRIORITIES.keys(), key=lambda x: REGION_PRIORITIES[x], reverse=True):
-        if priority_region and priority_region in region:
-            return REGION_PRIORITIES[priority_region]
+    for priority_region in _REGIONS_BY_PRIORITY:
+        if priority_region in region:
+            return _REGION_PRIORITIES[priority_region]
     
-    return REGION_PRIORITIES.get('', 0)
+    return _REGION_PRIORITIES['']
+
 
 def clean_name(name):
     """
@@ -76,37 +109,34 @@ def clean_name(name):
     # First, get base name without extension
     name = os.path.splitext(name)[0]
     
-    # Remove side/part/disk numbers first
-    name = re.sub(r'\s*[\(\[]?(Side|Part|Disk)\s*[0-9]+[\)\]]?.*$', '', name, flags=re.IGNORECASE)
-    
-    # Remove region and language markers
-    name = re.sub(r'\s*[\(\[](USA|Europe|World|Japan|Eur?|Jp|En|PAL|NTSC)[^\)\]]*[\]\)]', '', name, flags=re.IGNORECASE)
+    # Each pass below is skipped when the name can't match it; most names only
+    # need a few of them, and a substring test is far cheaper than a regex scan
     
-    # Remove version info
-    name = re.sub(r'\s*[\(\[]v[\d\.]+[\)\]]', '', name, flags=re.IGNORECASE)
-    name = re.sub(r'v[\d\.]+\b', '', name)  # Also remove version without parentheses
-    name = re.sub(r'\s*[\(\[]Version\s+[a-z0-9\.]+[\)\]]', '', name, flags=re.IGNORECASE)
+    # Remove side/part/disk numbers first
+    folded = name.casefold()
+    if 'side' in folded or 'part' in folded or 'disk' in folded:
+        name = _PART_SUFFIX_RE.sub('', name)
     
-    # Remove common suffixes in parentheses
-    name = re.sub(r'\s*[\(\[](Budget|Alt|Alternative|Unl|Aftermarket|Program|Tape\s*Port\s*Dongle)[\]\)]', '', name, flags=re.IGNORECASE)
+    has_parens = '(' in name
+    has_brackets = '[' in name
     
-    # Remove collection markers
-    name = re.sub(r'\s*[\(\[](Compilation|Collection)[\]\)]', '', name, flags=re.IGNORECASE)
+    # Remove region, language, version, suffix and collection markers
+    if has_parens or has_brackets:
+        name = _TAG_RE.sub('', name)
+    if 'v' in name:
+        name = _VERSION_RE.sub('', name)  # Also remove version without parentheses
     
     # Convert roman numerals (but not if they're part of a larger word)
-    name = re.sub(r'\bII\b', '2', name)
-    name = re.sub(r'\bIII\b', '3', name)
-    name = re.sub(r'\bIV\b', '4', name)
-    name = re.sub(r'\bVI\b', '6', name)
-    name = re.sub(r'\bVII\b', '7', name)
-    name = re.sub(r'\bVIII\b', '8', name)
+    if 'I' in name:
+        name = _ROMAN_RE.sub(lambda match: _ROMAN_NUMERALS[match.group(0)], name)
     
     # Remove any remaining parentheses and their contents
-    name = re.sub(r'\s*\([^)]*\)', '', name)
-    name = re.sub(r'\s*\[[^\]]*\]', '', name)
+    if has_parens:
+        name = _PARENS_RE.sub('', name)
+    if has_brackets:
+        name = _BRACKETS_RE.sub('', name)
     
     # Clean up spaces and special characters
-    name = name.strip()
-    name = re.sub(r'\s+', ' ', name)
+    name = ' '.join(name.split())
     
     return name
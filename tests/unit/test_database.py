@@ -5,8 +5,9 @@ import unittest
 import sqlite3
 import os
 import tempfile
-from db.database import DatabaseManager
+from db.database import DatabaseManager, MMAP_SIZE
 from db.game_repository import GameRepository
+from core.processor import GameRecord
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -39,13 +40,37 @@ class TestDatabaseManager(unittest.TestCase):
         self.repository.db_manager.execute("SELECT name FROM sqlite_master WHERE type='index'")
         indexes = [row[0] for row in self.repository.db_manager.fetchall()]
         self.assertIn("idx_games_clean_name", indexes)
-        self.assertIn("idx_versions_format", indexes)
-        self.assertIn("idx_versions_game_id", indexes)
-        self.assertIn("idx_versions_collection", indexes)
-        self.assertIn("idx_versions_format_priority", indexes)
+        self.assertIn("idx_versions_rank", indexes)
         self.assertIn("idx_parts_version_id", indexes)
         self.assertIn("idx_parts_part_number", indexes)
         
+    def test_connect_bulk_load(self):
+        """Test that a bulk load connection relaxes durability settings"""
+        self.db.close()
+        conn = self.db.connect(bulk_load=True)
+
+        self.db.execute("PRAGMA synchronous")
+        self.assertEqual(self.db.fetchone()[0], 0)  # OFF
+        self.db.execute("PRAGMA journal_mode")
+        self.assertEqual(self.db.fetchone()[0], "memory")
+        self.assertIsNone(conn.isolation_level)
+
+    def test_connect_enables_mmap(self):
+        """Test that connections memory-map the database file"""
+        self.db.execute("PRAGMA mmap_size")
+        self.assertEqual(self.db.fetchone()[0], MMAP_SIZE)
+
+    def test_connect_read_only(self):
+        """Test that a read-only connection can query but not write"""
+        self.db.create_schema()
+        self.db.close()
+        self.db.connect(read_only=True)
+
+        self.db.execute("SELECT COUNT(*) FROM games")
+        self.assertEqual(self.db.fetchone()[0], 0)
+        with self.assertRaises(sqlite3.OperationalError):
+            self.db.execute("INSERT INTO games (clean_name) VALUES (?)", ("Game",))
+
     def test_reset_schema(self):
         # Create some test data
         self.repository.db_manager.create_schema()
@@ -87,6 +112,18 @@ class TestDatabaseManager(unittest.TestCase):
         self.repository.db_manager.execute("SELECT COUNT(*) FROM game_parts")
         self.assertEqual(self.repository.db_manager.fetchone()[0], 0)
         
+    def test_reset_schema_defers_indexes(self):
+        """Test that reset_schema only keeps the unique name index until create_indexes runs"""
+        self.db.reset_schema()
+        self.db.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        self.assertEqual([row[0] for row in self.db.fetchall()], ["idx_games_clean_name"])
+
+        self.db.create_indexes()
+        self.db.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = [row[0] for row in self.db.fetchall()]
+        self.assertIn("idx_versions_rank", indexes)
+        self.assertIn("idx_parts_version_id", indexes)
+
     def test_insert_game(self):
         # Create schema
         self.repository.db_manager.create_schema()
@@ -247,7 +284,78 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertEqual(self.repository.db_manager.fetchone()[0], 2)
         self.repository.db_manager.execute("SELECT COUNT(*) FROM game_parts")
         self.assertEqual(self.repository.db_manager.fetchone()[0], 2)
-        
+
+    def test_insert_normalizes_source_path(self):
+        """Test that source paths are stored with forward slashes"""
+        self.repository.db_manager.create_schema()
+
+        game_data = {
+            'source_path': 'src\\Collection1\\Game.crt',
+            'original_name': 'Game.crt',
+            'clean_name': 'Game',
+            'format': 'crt',
+            'collection': 'Collection1',
+            'format_priority': 3,
+            'part_number': 0
+        }
+        self.repository.insert_game(game_data)
+        self.repository.insert_many([GameRecord(**dict(game_data, source_path='src\\Collection2\\Game.crt',
+                                                       collection='Collection2'),
+                                                region='', region_priority=0, is_multi_part=0)])
+
+        self.repository.db_manager.execute("SELECT source_path FROM game_parts ORDER BY id")
+        paths = [row[0] for row in self.repository.db_manager.fetchall()]
+        self.assertEqual(paths, ['src/Collection1/Game.crt', 'src/Collection2/Game.crt'])
+
+    def test_insert_many_without_normalizing(self):
+        """Test that already normalized records are stored as given"""
+        self.repository.db_manager.create_schema()
+
+        record = GameRecord('src/Collection1/Game\\1.crt', 'Game\\1.crt', 'Game', 'crt',
+                            'Collection1', 3, '', 0, 0, 0)
+        self.repository.insert_many([record], normalize_paths=False)
+
+        self.repository.db_manager.execute("SELECT source_path FROM game_parts")
+        self.assertEqual(self.repository.db_manager.fetchone()[0], 'src/Collection1/Game\\1.crt')
+
+    def test_insert_games_matches_insert_game(self):
+        """Test that bulk insertion applies the same version and part rules as insert_game"""
+        self.repository.db_manager.create_schema()
+
+        base = GameRecord(
+            source_path='', original_name='', clean_name='Game', format='d64', collection='Collection1',
+            format_priority=2, region='', region_priority=0, is_multi_part=1, part_number=0
+        )
+        games = [
+            base._replace(source_path='path/game_disk1.d64', original_name='Game (Disk 1).d64', part_number=1),
+            base._replace(source_path='path/game_disk2.d64', original_name='Game (Disk 2).d64', part_number=2),
+            base._replace(source_path='path/game_disk1.d64', original_name='Game (Disk 1).d64', part_number=1),
+            base._replace(source_path='path/game_alt.d64', original_name='Game (Disk 1) (Alt).d64', part_number=1),
+            base._replace(source_path='path/game2.crt', original_name='Game2.crt', clean_name='Game2',
+                          format='crt', format_priority=3, is_multi_part=0, part_number=0)
+        ]
+
+        inserted = self.repository.insert_many(games)
+
+        # Duplicate part is skipped, Alt file gets its own version
+        self.assertEqual(inserted, 4)
+        self.repository.db_manager.execute("SELECT COUNT(*) FROM games")
+        self.assertEqual(self.repository.db_manager.fetchone()[0], 2)
+        self.repository.db_manager.execute("SELECT COUNT(*) FROM game_versions")
+        self.assertEqual(self.repository.db_manager.fetchone()[0], 3)
+        self.repository.db_manager.execute("""
+            SELECT p.part_number FROM game_parts p
+            JOIN game_versions v ON v.id = p.version_id
+            JOIN games g ON g.id = v.game_id
+            WHERE g.clean_name = 'Game' AND v.id = (SELECT MIN(id) FROM game_versions)
+            ORDER BY p.part_number""")
+        self.assertEqual([row[0] for row in self.repository.db_manager.fetchall()], [1, 2])
+
+        # Re-inserting existing parts adds nothing
+        self.repository.insert_many(games[:3])
+        self.repository.db_manager.execute("SELECT COUNT(*) FROM game_parts")
+        self.assertEqual(self.repository.db_manager.fetchone()[0], 4)
+
     def test_get_best_versions(self):
         """Test getting the best version of each game."""
         self.repository.db_manager.create_schema()
@@ -4,8 +4,10 @@ Unit tests for the format handler utility.
 import unittest
 from utils.format_handler import (
     get_format_priority, 
+    format_priority_for_ext,
     is_multi_part, 
-    get_multi_part_info
+    get_multi_part_info,
+    get_multi_part
 )
 
 
@@ -25,6 +27,13 @@ class TestFormatHandler(unittest.TestCase):
         self.assertEqual(get_format_priority("Game (Europe) (Re-release).tap"), 1)
         self.assertEqual(get_format_priority("Game.unknown"), 0)  # Unknown format
         
+    def test_format_priority_for_ext(self):
+        # Same priorities as get_format_priority, for an already extracted extension
+        self.assertEqual(format_priority_for_ext("crt"), 3)
+        self.assertEqual(format_priority_for_ext("d64"), 2)
+        self.assertEqual(format_priority_for_ext("tap"), 1)
+        self.assertEqual(format_priority_for_ext("unknown"), 0)
+        
     def test_is_multi_part(self):
         # Basic multi-part patterns
         self.assertTrue(is_multi_part("", "Game (Disk 1).crt"))
@@ -105,6 +114,34 @@ class TestFormatHandler(unittest.TestCase):
         self.assertEqual(
             get_multi_part_info("", "Lords of Doom EF-Savedisk.d64"), 0)
         
+    def test_get_multi_part(self):
+        # Combined check must agree with is_multi_part + get_multi_part_info
+        cases = [
+            ("", "Game (Disk 1).crt"),
+            ("", "Ace 2088 (Europe) (Side B).tap"),
+            ("", "Deliverance - Stormlord II (Levels 3 and 4) (J1).crt"),
+            ("path/to/Disk 4/", "Game.crt"),
+            ("Game/Side A/", "file.tap"),
+            ("", "Game (Part 2) (Re-release).tap"),
+            ("", "Game.crt"),
+            ("", "Game (v2).tap"),
+            ("", "10th Frame (USA) (Tape Port Dongle).nib"),
+            ("", "Action Replay (Disk 1).crt")
+        ]
+        for path, name in cases:
+            is_multi = is_multi_part(path, name)
+            expected = (is_multi, get_multi_part_info(path, name) if is_multi else 0)
+            self.assertEqual(get_multi_part(path, name), expected, name)
+        
+    def test_multi_part_full_file_path(self):
+        # A path that already ends with the name is searched once, not joined with
+        # the name again (which would put "t64" + "MON" together and skip the file)
+        path = "roms/MONSTER HUNT (Disk 2).t64"
+        name = "MONSTER HUNT (Disk 2).t64"
+        self.assertTrue(is_multi_part(path, name))
+        self.assertEqual(get_multi_part_info(path, name), 2)
+        self.assertEqual(get_multi_part(path, name), (True, 2))
+        
     def test_complex_directory_structures(self):
         # Test handling nested paths with region/version info
         base_path = "src/No-Intro/100% Dynamite (USA, Europe) (Compilation)/"
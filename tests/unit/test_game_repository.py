@@ -128,6 +128,23 @@ class TestGameRepository(unittest.TestCase):
         game_formats = {(game[0], game[1]) for game in best_versions}  # (clean_name, format)
         self.assertEqual(game_formats, {('Game', 'crt'), ('Game2', 'tap')})
 
+    def test_get_best_versions_tie_keeps_first_inserted(self):
+        """Test that tied versions resolve to the one inserted first."""
+        # g64 and d64 share a format priority, and both are in the same collection
+        g64_data = {**self.game_data, 'source_path': 'path/to/game.g64',
+                    'original_name': 'Game.g64', 'format': 'g64', 'format_priority': 2}
+        d64_data = {**self.game_data, 'source_path': 'path/to/game.d64',
+                    'original_name': 'Game.d64', 'format': 'd64', 'format_priority': 2}
+        
+        self.repository.insert_game(g64_data)
+        self.repository.insert_game(d64_data)
+        
+        best_versions = list(self.repository.get_best_versions())
+        
+        self.assertEqual(len(best_versions), 1)
+        self.assertEqual(best_versions[0][1], 'g64')
+        self.assertEqual(best_versions[0][2], 'path/to/game.g64')
+
 
 if __name__ == '__main__':
     unittest.main()
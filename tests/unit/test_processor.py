@@ -4,6 +4,7 @@ Unit tests for the processor module.
 import unittest
 from unittest import mock
 import os
+import tempfile
 from core.processor import process_file, scan_directory
 
 
@@ -16,14 +17,14 @@ class TestProcessor(unittest.TestCase):
         
         result = process_file(file_path, collection)
         
-        self.assertEqual(result['source_path'], file_path)
-        self.assertEqual(result['original_name'], "Game (Europe) (v1.2).crt")
-        self.assertEqual(result['clean_name'], "Game")
-        self.assertEqual(result['format'], "crt")
-        self.assertEqual(result['collection'], "Collection1")
-        self.assertEqual(result['format_priority'], 3)
-        self.assertEqual(result['is_multi_part'], 0)
-        self.assertEqual(result['part_number'], 0)
+        self.assertEqual(result.source_path, file_path)
+        self.assertEqual(result.original_name, "Game (Europe) (v1.2).crt")
+        self.assertEqual(result.clean_name, "Game")
+        self.assertEqual(result.format, "crt")
+        self.assertEqual(result.collection, "Collection1")
+        self.assertEqual(result.format_priority, 3)
+        self.assertEqual(result.is_multi_part, 0)
+        self.assertEqual(result.part_number, 0)
         
     def test_process_multi_part_file(self):
         # Test processing a multi-part file
@@ -32,11 +33,11 @@ class TestProcessor(unittest.TestCase):
         
         result = process_file(file_path, collection)
         
-        self.assertEqual(result['clean_name'], "Game")
-        self.assertEqual(result['format'], "d64")
-        self.assertEqual(result['format_priority'], 2)
-        self.assertEqual(result['is_multi_part'], 1)
-        self.assertEqual(result['part_number'], 2)
+        self.assertEqual(result.clean_name, "Game")
+        self.assertEqual(result.format, "d64")
+        self.assertEqual(result.format_priority, 2)
+        self.assertEqual(result.is_multi_part, 1)
+        self.assertEqual(result.part_number, 2)
         
     def test_process_empty_name(self):
         # Test with a file that results in an empty clean name
@@ -48,40 +49,53 @@ class TestProcessor(unittest.TestCase):
         
         self.assertIsNone(result)
         
-    @mock.patch('os.walk')
     @mock.patch('core.processor.process_file')
     @mock.patch('core.processor.should_skip_file')
-    def test_scan_directory(self, mock_should_skip, mock_process_file, mock_walk):
-        # Mock os.walk to return some test files
-        mock_walk.return_value = [
-            ('/base/dir', ['subdir'], ['game1.crt', 'game2.d64', 'utility.tap', 'bad.bin']),
-            ('/base/dir/subdir', [], ['game3.tap', 'bios.crt'])
-        ]
+    def test_scan_directory(self, mock_should_skip, mock_process_file):
+        # Create a directory tree with some test files
+        with tempfile.TemporaryDirectory() as base_dir:
+            os.makedirs(os.path.join(base_dir, 'subdir'))
+            for name in ['game1.crt', 'game2.d64', 'utility.tap', 'bad.bin',
+                         os.path.join('subdir', 'game3.tap'), os.path.join('subdir', 'bios.crt')]:
+                open(os.path.join(base_dir, name), 'w').close()
+            
+            # Mock should_skip_file to skip utility.tap and bios.crt
+            def mock_skip(path, filename):
+                return filename in ['utility.tap', 'bios.crt', 'bad.bin']
+            mock_should_skip.side_effect = mock_skip
         
-        # Mock should_skip_file to skip utility.tap and bios.crt
-        def mock_skip(path, filename):
-            return filename in ['utility.tap', 'bios.crt', 'bad.bin']
-        mock_should_skip.side_effect = mock_skip
+            # Mock process_file to return test data for valid files
+            def mock_process(file_path, collection, original_name=None):
+                filename = os.path.basename(file_path)
+                if filename == 'game1.crt':
+                    return {'clean_name': 'Game1', 'format': 'crt', 'is_multi_part': 0}
+                elif filename == 'game2.d64':
+                    return {'clean_name': 'Game2', 'format': 'd64', 'is_multi_part': 0}
+                elif filename == 'game3.tap':
+                    return {'clean_name': 'Game3', 'format': 'tap', 'is_multi_part': 1}
+                return None
+            mock_process_file.side_effect = mock_process
         
-        # Mock process_file to return test data for valid files
-        def mock_process(file_path, collection):
-            filename = os.path.basename(file_path)
-            if filename == 'game1.crt':
-                return {'clean_name': 'Game1', 'format': 'crt', 'is_multi_part': 0}
-            elif filename == 'game2.d64':
-                return {'clean_name': 'Game2', 'format': 'd64', 'is_multi_part': 0}
-            elif filename == 'game3.tap':
-                return {'clean_name': 'Game3', 'format': 'tap', 'is_multi_part': 1}
-            return None
-        mock_process_file.side_effect = mock_process
+            # Call the function
+            result, skipped, errors = scan_directory(base_dir, 'TestCollection')
         
-        # Call the function
-        result, skipped, errors = scan_directory('/base/dir', 'TestCollection')
-        
-        # Check results
-        self.assertEqual(len(result), 3)  # 3 valid games processed
-        self.assertEqual(skipped, 3)  # 3 files skipped
-        self.assertEqual(errors, 0)  # No errors
+            # Check results
+            self.assertEqual(len(result), 3)  # 3 valid games processed
+            self.assertEqual(skipped, 3)  # 3 files skipped
+            self.assertEqual(errors, 0)  # No errors
+
+    def test_scan_directory_prunes_originals(self):
+        # Files inside an Originals folder are never scanned
+        with tempfile.TemporaryDirectory() as base_dir:
+            os.makedirs(os.path.join(base_dir, 'Originals'))
+            open(os.path.join(base_dir, 'Game1.crt'), 'w').close()
+            open(os.path.join(base_dir, 'Originals', 'Game2.crt'), 'w').close()
+
+            result, skipped, errors = scan_directory(base_dir, 'TestCollection')
+
+            self.assertEqual([game.clean_name for game in result], ['Game1'])
+            self.assertEqual(skipped, 0)
+            self.assertEqual(errors, 0)
 
 
 if __name__ == '__main__':